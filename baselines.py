@@ -0,0 +1,118 @@
+import json
+import math
+import os
+
+# ==== CONFIG ====
+BASELINES_FILE = "baselines.json"
+MIN_SESSIONS_FOR_Z = 2  # need at least two past sessions for a variance
+
+def load_baselines(path: str = BASELINES_FILE) -> dict:
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def save_baselines(baselines: dict, path: str = BASELINES_FILE):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(baselines, f, indent=2)
+    os.replace(tmp_path, path)
+
+def extract_metrics(result: dict, known_keys=()) -> dict:
+    """
+    Flatten an analysis result into { "metric.name": number }.
+    Sub-scores become "<category>.<sub>", fillers become
+    "fillers.total" plus "fillers.<token>". Missing/null values are skipped,
+    so partial results only touch the metrics they actually cover.
+    When filler_words is present, any "fillers.<token>" in known_keys that
+    didn't occur this session is emitted as 0.0.
+    """
+    metrics = {}
+    for category, subs in (result.get("scores") or {}).items():
+        if not isinstance(subs, dict):
+            continue
+        for sub, value in subs.items():
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                metrics[f"{category}.{sub}"] = float(value)
+
+    fillers = (result.get("disfluencies") or {}).get("filler_words")
+    if isinstance(fillers, list):
+        total = 0
+        for key in known_keys:
+            if key.startswith("fillers.") and key != "fillers.total":
+                metrics[key] = 0.0
+        for item in fillers:
+            if not isinstance(item, dict):
+                continue
+            token = (item.get("token") or "").strip().lower()
+            count = item.get("count")
+            if not token or not isinstance(count, int):
+                continue
+            key = f"fillers.{token}"
+            metrics[key] = metrics.get(key, 0.0) + count
+            total += count
+        metrics["fillers.total"] = float(total)
+    return metrics
+
+def welford_update(stats: dict, value: float) -> dict:
+    """One Welford step on { "n", "mean", "m2" } — O(1), no history kept."""
+    n = stats.get("n", 0) + 1
+    mean = stats.get("mean", 0.0)
+    delta = value - mean
+    mean += delta / n
+    m2 = stats.get("m2", 0.0) + delta * (value - mean)
+    return {"n": n, "mean": mean, "m2": m2}
+
+def stddev(stats: dict):
+    n = stats.get("n", 0)
+    if n < MIN_SESSIONS_FOR_Z:
+        return None
+    return math.sqrt(stats["m2"] / (n - 1))
+
+def compare_to_baseline(baselines: dict, user_id: str, metrics: dict) -> dict:
+    """
+    Compare this session's metrics against the user's prior sessions.
+    Returns { metric: { value, baseline_mean, delta, z_score, sessions } };
+    z_score is None until there are enough sessions or when variance is 0.
+    """
+    user_stats = baselines.get(user_id, {})
+    comparison = {}
+    for key, value in metrics.items():
+        stats = user_stats.get(key)
+        if not stats or stats.get("n", 0) == 0:
+            comparison[key] = {
+                "value": value,
+                "baseline_mean": None,
+                "delta": None,
+                "z_score": None,
+                "sessions": 0,
+            }
+            continue
+        sd = stddev(stats)
+        delta = value - stats["mean"]
+        comparison[key] = {
+            "value": value,
+            "baseline_mean": round(stats["mean"], 3),
+            "delta": round(delta, 3),
+            "z_score": round(delta / sd, 3) if sd else None,
+            "sessions": stats["n"],
+        }
+    return comparison
+
+def update_baseline(baselines: dict, user_id: str, metrics: dict) -> dict:
+    user_stats = baselines.setdefault(user_id, {})
+    for key, value in metrics.items():
+        user_stats[key] = welford_update(user_stats.get(key, {}), value)
+    return baselines
+
+def compare_and_update(result: dict, user_id: str, path: str = BASELINES_FILE) -> dict:
+    """
+    Attach result["comparison"] (vs. the user's earlier sessions) and fold
+    this session into the stored baseline. No model call involved.
+    """
+    baselines = load_baselines(path)
+    metrics = extract_metrics(result, baselines.get(user_id, {}).keys())
+    result["comparison"] = compare_to_baseline(baselines, user_id, metrics)
+    update_baseline(baselines, user_id, metrics)
+    save_baselines(baselines, path)
+    return result